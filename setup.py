@@ -1,3 +1,5 @@
+import os
+
 import setuptools
 
 
@@ -10,6 +12,21 @@ with open("CHANGELOG.md", "r", encoding="utf-8") as fh:
     long_description += fh.read()
 
 
+# Compile the hot modules to C extensions, with Cython or mypyc, when
+# speedups are requested explicitly.  The modules stay importable as
+# pure-python otherwise.  The compiler must already be installed, so build
+# with `pip install --no-build-isolation`.
+ext_modules = []
+if os.environ.get("HYPERAD_ENABLE_SPEEDUPS") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(["src/hyperad/contents.py"], language_level=3)
+elif os.environ.get("HYPERAD_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/hyperad/contents.py"])
+
+
 setuptools.setup(
     name="hyperad",
     version="0.0.1",
@@ -30,8 +47,13 @@ setuptools.setup(
     ],
     package_dir={"": "src"},
     packages=setuptools.find_packages(where="src"),
+    # The Cython declarations of `contents.py`, which a speedups build from
+    # the sdist needs.
+    package_data={"hyperad": ["*.pxd"]},
     python_requires=">=3.7.1",
     install_requires=[],
+    extras_require={"orjson": ["orjson"], "async": ["httpx"]},
+    ext_modules=ext_modules,
     setup_requires=["pytest-runner==4.4"],
     tests_require=["pytest==4.4.1"],
     test_suite="tests",
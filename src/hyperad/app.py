@@ -1,9 +1,32 @@
+from functools import partial
+
 from requests.sessions import Session
 
 from hyperad import constants
 from hyperad.contents import Content
 
 
+# Parameters of `Session.request()` which are built from the `Content` object.
+_INVALID_KWARGS = frozenset(("data", "json", "files", "params"))
+
+
+class _CMethod:
+    """ The `c*` methods, e.g. `cget`, which call `crequest()` with their
+    HTTP method.  The bound method is a `partial` of `self.crequest`, so it
+    also calls the `crequest()` which a subclass overrides.
+    """
+    __slots__ = ("_method",)
+
+    def __init__(self, method):
+        self._method = method
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        return partial(obj.crequest, self._method)
+
+
 class App(Session):
     """ A extensive class of `requests.Session` which supports sending data in
     different formats.  `App` also provides some methods to process the
@@ -54,44 +77,48 @@ class App(Session):
             (.pem).  If `tuple`, ('cert', 'key') pair.
         @rtype: `requests.Response`.
         """
-        invalid_params = ("data", "json", "files", "params")
-        for name in invalid_params:
-            if name in kwargs.keys():
-                raise ValueError("Don't use these parameters {}. They "
-                "have already been included in `Content` object."
-                .format(invalid_params)
-                )
+        invalid_params = _INVALID_KWARGS.intersection(kwargs)
+        if invalid_params:
+            raise ValueError("Don't use these parameters {}. They "
+            "have already been included in `Content` object."
+            .format(sorted(invalid_params))
+            )
 
         parameters = content.build()
+        params = parameters.pop("params", None)
+        data = parameters.pop("data", None)
+        files = parameters.pop("files", None)
+        json = parameters.pop("json", None)
+
+        headers = parameters.pop("headers", None)
+        user_headers = kwargs.pop("headers", None)
+        if headers is None:
+            headers = user_headers
+        elif user_headers:
+            headers.update(user_headers)
+
+        # Other parameters built by the `Content` are passed on as well, and
+        # the caller's ones take precedence over them.
+        if parameters:
+            parameters.update(kwargs)
+            kwargs = parameters
+
+        return self.request(method, url,
+            params=params,
+            data=data,
+            files=files,
+            json=json,
+            headers=headers,
+            **kwargs
+        )
 
-        headers = kwargs.pop("headers", None)
-        if headers and ("headers" in parameters.keys()):
-            parameters["headers"].update(headers)
-
-        parameters.update(kwargs)
-
-        return self.request(method, url, **parameters)
-
-    def cget(self, url, content: Content, **kwargs):
-        return self.crequest(constants.GET, url, content, **kwargs)
-        
-    def cpost(self, url, content: Content, **kwargs):
-        return self.crequest(constants.POST, url, content, **kwargs)
-        
-    def cput(self, url, content: Content, **kwargs):
-        return self.crequest(constants.PUT, url, content, **kwargs)
-        
-    def cdelete(self, url, content: Content, **kwargs):
-        return self.crequest(constants.DELETE, url, content, **kwargs)
-        
-    def coptions(self, url, content: Content, **kwargs):
-        return self.crequest(constants.OPTIONS, url, content, **kwargs)
-        
-    def chead(self, url, content: Content, **kwargs):
-        return self.crequest(constants.HEAD, url, content, **kwargs)
-        
-    def cpatch(self, url, content: Content, **kwargs):
-        return self.crequest(constants.PATCH, url, content, **kwargs)
+    cget = _CMethod(constants.GET)
+    cpost = _CMethod(constants.POST)
+    cput = _CMethod(constants.PUT)
+    cdelete = _CMethod(constants.DELETE)
+    coptions = _CMethod(constants.OPTIONS)
+    chead = _CMethod(constants.HEAD)
+    cpatch = _CMethod(constants.PATCH)
 
     def download(self, method, url, content, save_as, **kwargs):
         raise NotImplementedError("Haven't been implemented yet")
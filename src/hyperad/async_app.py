@@ -0,0 +1,172 @@
+import io
+from functools import partial
+
+import httpx
+
+from hyperad import constants
+from hyperad.contents import Content
+
+
+# Parameters of `AsyncClient.request()` which are built from the `Content`
+# object.
+_INVALID_KWARGS = frozenset(("content", "data", "json", "files", "params"))
+
+
+# Bytes-like objects which httpx doesn't take as a body or file themselves.
+_BYTES_LIKE = (bytearray, memoryview)
+
+
+async def _aiter_chunks(iterable):
+    # `AsyncClient` only streams asynchronous iterables of bytes.
+    for chunk in iterable:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        elif not isinstance(chunk, bytes):
+            # Raises TypeError if the chunk isn't bytes-like.
+            chunk = bytes(memoryview(chunk))
+        yield chunk
+
+
+def _decode(value):
+    # httpx takes `str` names, and writes `bytes` values in url-encoded data
+    # as their repr, while requests sends both as the raw bytes.
+    if not isinstance(value, bytes):
+        return value
+
+    try:
+        return value.decode()
+    except UnicodeDecodeError:
+        raise ValueError("{!r} can't be sent by AsyncApp, only UTF-8 "
+        "bytes names and values are supported".format(value))
+
+
+def _decode_form(form: dict, values: bool) -> dict:
+    decoded = {}
+    for name, value in form.items():
+        if values:
+            if isinstance(value, list):
+                value = [_decode(v) for v in value]
+            else:
+                value = _decode(value)
+
+        decoded[_decode(name)] = value
+
+    return decoded
+
+
+def _to_httpx(parameters: dict) -> dict:
+    """ Convert the parameters built by a `Content` for `requests.request()`
+    into the ones of `httpx.AsyncClient.request()`.
+    """
+    if parameters.get("params"):
+        parameters["params"] = _decode_form(parameters["params"], True)
+
+    data = parameters.pop("data", None)
+    files = parameters.pop("files", None)
+    if isinstance(data, dict) or data is None:
+        # Form fields, which are encoded as multipart/form-data along with
+        # `files` if there is any.  Multipart values may stay `bytes`.
+        if data:
+            parameters["data"] = _decode_form(data, not files)
+    elif isinstance(data, (str, bytes)):
+        parameters["content"] = data
+    elif isinstance(data, _BYTES_LIKE):
+        parameters["content"] = bytes(data)
+    elif hasattr(data, "read"):
+        parameters["content"] = data.read()
+    else:
+        parameters["content"] = _aiter_chunks(data)
+
+    if files:
+        # httpx only uploads `bytes`, `str` and files opened in binary mode.
+        parameters["files"] = {}
+        for name, (filename, file, enctype) in files.items():
+            if isinstance(file, io.TextIOBase):
+                file = file.read()
+            elif isinstance(file, _BYTES_LIKE):
+                file = bytes(file)
+
+            parameters["files"][_decode(name)] = (filename, file, enctype)
+
+    return parameters
+
+
+class _CMethod:
+    """ The `c*` methods, e.g. `cget`, which call `crequest()` with their
+    HTTP method.  The bound method is a `partial` of `self.crequest`, so it
+    also calls the `crequest()` which a subclass overrides.
+    """
+    __slots__ = ("_method",)
+
+    def __init__(self, method):
+        self._method = method
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        return partial(obj.crequest, self._method)
+
+
+class AsyncApp(httpx.AsyncClient):
+    """ An asynchronous counterpart of `App` based on `httpx.AsyncClient`.
+    Many `Content`s can be submitted concurrently, e.g. by
+    `asyncio.gather()`, over the connections of a single client.
+
+    New methods:
+    - `AsyncApp.crequest()`: is a substitution of `AsyncClient.request()`.
+    - `AsyncApp.c*()`: in which `*` is (`get`, `post`, `put`, ...), is
+    substitutions of `AsyncClient.get()`, `AsyncClient.post()`, ...
+
+    Usage:
+    >>> forms = [MultiContent("form-{}".format(i)) for i in range(10)]
+    >>> async with AsyncApp() as app:
+    ...     resps = await asyncio.gather(
+    ...         *(app.cpost("http://some.url/submit", f) for f in forms)
+    ...     )
+    """
+
+    async def crequest(self, method, url, content: Content, **kwargs):
+        """ Submit some formated data to url.
+        @param `method`: method for the new :class:`Request` object.
+        @param `url`: URL for the new :class:`Request` object.
+        @param `headers`: (optional) `dict` of HTTP Headers to send with\
+            the :class:`Request`.
+        @param `cookies`: (optional) `dict` or `Cookies` object to send with\
+            the :class:`Request`.
+        @param `auth`: (optional) Auth `tuple` or `callable` to enable\
+            Basic/Digest/Custom HTTP Auth.
+        @param `timeout`: (optional) How long to wait for the server, as a\
+            `float` or an `httpx.Timeout` object.
+        @param `follow_redirects`: (optional) Whether redirects are followed.
+        @param `extensions`: (optional) `dict` of request extensions.
+        @rtype: `httpx.Response`.
+        """
+        invalid_params = _INVALID_KWARGS.intersection(kwargs)
+        if invalid_params:
+            raise ValueError("Don't use these parameters {}. They "
+            "have already been included in `Content` object."
+            .format(sorted(invalid_params))
+            )
+
+        parameters = _to_httpx(content.build())
+
+        headers = kwargs.pop("headers", None)
+        if headers:
+            # Header names are case-insensitive, so the caller's headers
+            # replace the built ones whatever their case is.
+            merged = httpx.Headers(parameters.get("headers"))
+            merged.update(headers)
+            parameters["headers"] = merged
+
+        parameters.update(kwargs)
+
+        return await self.request(method, url, **parameters)
+
+    cget = _CMethod(constants.GET)
+    cpost = _CMethod(constants.POST)
+    cput = _CMethod(constants.PUT)
+    cdelete = _CMethod(constants.DELETE)
+    coptions = _CMethod(constants.OPTIONS)
+    chead = _CMethod(constants.HEAD)
+    cpatch = _CMethod(constants.PATCH)
@@ -0,0 +1,30 @@
+# Cython augmentation of contents.py.  It is only used when the package is
+# built with HYPERAD_ENABLE_SPEEDUPS=1; contents.py stays pure-python.
+
+cdef class Content:
+    cdef public object _name
+
+cdef class ParamContent(Content):
+    cdef public object _value
+
+cdef class FieldContent(Content):
+    cdef public object _value
+
+cdef class FileContent(Content):
+    cdef public object _file
+    cdef public object _filename
+    cdef public str _enctype
+    cdef public dict _headers
+    cdef public object _body
+
+cdef class JSONContent(Content):
+    cdef public object _json
+    cdef public bytes _serialized
+
+cdef class MultiContent(Content):
+    cdef public list _params
+    cdef public list _fields
+    cdef public list _files
+    cdef public str _enctype
+
+    cpdef dict _build(self)
@@ -1,25 +1,147 @@
 import io
 import os
-import abc
 import mimetypes
+from functools import lru_cache
 from json import dumps as jsondumps
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import (
+    Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+)
 
 from hyperad.constants import (
-    CONTENT_TYPE, CONTENT_DISPOSITION,
+    CONTENT_TYPE, CONTENT_DISPOSITION, CONTENT_LENGTH,
     APPLICATION_JSON, MULTIPART_FORM_DATA, TEXT_PLAIN,
     APPLICATION_X_WWW_FORM_URLENCODED, APPLICATION_OCTET_STREAM,
 )
 from hyperad.errors import DuplicateValue
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+_REQUEST_PARAMS = Dict[str, Any]
+
+# Load the mimetypes database now rather than on the first `FileContent`.
+# Types which have already been loaded or added by the user are kept.
+if not mimetypes.inited:
+    mimetypes.init()
+
+# Kinds of `Content` which can be added to a `MultiContent`.  Each of these
+# classes stores its kind in the `_KIND` class attribute.
+_KIND_PARAM = 0
+_KIND_FIELD = 1
+_KIND_FILE = 2
+_KIND_JSON = 3
+
+
+# orjson refuses to nest deeper than this.  Stopping the walk there also
+# keeps circular references from overflowing the C stack when this module
+# is compiled, as compiled functions don't check the recursion limit.
+_MAX_DEPTH = 254
+
+
+def _is_plain(obj: Any, depth: int = 0) -> bool:
+    """ Return whether `obj` only consists of `dict`, `list`, `tuple`, `str`,
+    `int`, `bool`, `None` and finite `float` objects, which orjson writes
+    like the standard encoder does.  Dict keys are left to orjson.
+    """
+    if depth > _MAX_DEPTH:
+        return False
+
+    t = type(obj)
+    if t is dict:
+        obj = obj.values()
+    elif t is not list and t is not tuple:
+        return t is str or t is int or t is bool or obj is None or (
+            t is float and obj - obj == 0.0
+        )
+
+    for value in obj:
+        t = type(value)
+        if t is str or t is int or t is bool or value is None:
+            continue
+
+        # `value - value` is NaN for NaN and Infinity.
+        if t is float:
+            if value - value != 0.0:
+                return False
+        elif not _is_plain(value, depth + 1):
+            return False
+
+    return True
+
+
+def _dumps(obj: Any) -> bytes:
+    """ Serialize `obj` to compact JSON bytes.  It accepts the same objects
+    as `json.dumps(obj, allow_nan=False)` does.  `orjson` is used if it is
+    installed.
+    """
+    # orjson natively writes a few values which the standard encoder
+    # rejects, e.g. NaN and Infinity (as null), UUID, Enum and datetime.
+    # Anything but plain JSON values is left to the standard encoder, and so
+    # are what orjson refuses, such as non-str keys or integers exceeding
+    # 64 bits.
+    if _HAS_ORJSON:
+        try:
+            if _is_plain(obj):
+                return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            pass
+
+    return jsondumps(obj, allow_nan=False, separators=(",", ":")).encode()
+
+
+# Bytes files larger than this are sent in chunks of `_CHUNK_SIZE`.
+_CHUNK_THRESHOLD = 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+
+class _Chunks:
+    """ An iterable over the chunks of a `bytes` object.  It is sent as a
+    streamed body, and its length lets the Content-Length be set instead of
+    using chunked transfer encoding.
+    """
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, data: Union[bytes, bytearray], size: int) -> None:
+        self._data = data
+        self._size = size
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        view = memoryview(self._data)
+        for i in range(0, len(view), self._size):
+            yield view[i:i + self._size]
+
 
-_REQUEST_PARAMS = Dict
+def _guess_type(filename: str) -> Optional[str]:
+    """ Guess the Content-Type of `filename` from its last two extensions,
+    e.g. `.tar.gz`, which is all `mimetypes.guess_type()` looks at.
+    """
+    base, ext = os.path.splitext(filename)
+    return _guess_suffix_type(os.path.splitext(base)[1] + ext)
+
+
+# Keyed on the extensions rather than the filename, so that uploading many
+# files of a few types keeps hitting the cache.  The extensions keep their
+# case as `mimetypes` matches them case-sensitively first.  Results are not
+# updated by a later `mimetypes.add_type()`, call
+# `_guess_suffix_type.cache_clear()` after adding a type.
+@lru_cache(maxsize=1024)
+def _guess_suffix_type(suffix: str) -> Optional[str]:
+    return mimetypes.guess_type("x" + suffix)[0]
 
 
-class Content(abc.ABC):
-    """ The abstract base class for a content submited to the web server.
+class Content:
+    """ The base class for a content submited to the web server.
     @param `name`: Name of `Content`.  It can be a `str` or `bytes` object.
     """
+    __slots__ = ("_name",)
+
     def __init__(self, name: Union[str, bytes]) -> None:
         super().__init__()
         if not isinstance(name, (str, bytes)):
@@ -27,24 +149,22 @@ class Content(abc.ABC):
 
         self._name = name
     
-    @abc.abstractmethod
     def _build(self) -> _REQUEST_PARAMS:
         """ Construct the paramters that are passed into `requests.request()`
         method.
         """
-        pass
+        raise NotImplementedError
 
     def build(self) -> _REQUEST_PARAMS:
         return self._build()
 
 
-    @abc.abstractmethod
-    def enctype(self) -> str:
+    def enctype(self) -> Optional[str]:
         """ Return the Content-Type of this `Content`.
         """
-        pass
+        raise NotImplementedError
 
-    def name(self) -> str:
+    def name(self) -> Union[str, bytes]:
         """ Return name of `Content`.
         """
         return self._name
@@ -55,7 +175,10 @@ class ParamContent(Content):
     parameter in url.
     @param `name`: Name of `Content`.
     @param `value`: Value data.  It can be `str` or `bytes` object.
-    """ 
+    """
+    __slots__ = ("_value",)
+    _KIND: ClassVar[int] = _KIND_PARAM
+
     def __init__(self,
             name: Union[str, bytes],
             value: Union[str, bytes]
@@ -72,7 +195,7 @@ class ParamContent(Content):
             "params": {self._name: self._value}
         }
 
-    def enctype(self) -> str:
+    def enctype(self) -> Optional[str]:
         # Because it is sent in the url, there is no type of this Content
         return None
 
@@ -83,6 +206,9 @@ class FieldContent(Content):
     @param `name`: Name of `Content`.
     @param `value`: Value data.  It can be `str` or `bytes` object.
     """
+    __slots__ = ("_value",)
+    _KIND: ClassVar[int] = _KIND_FIELD
+
     def __init__(self,
             name: Union[str, bytes],
             value: Union[str, bytes]
@@ -112,20 +238,22 @@ class FileContent(Content):
     @param `file`: A `bytes` or `io` or `str` or `iterable` object\
         representing the file uploaded to the web server.
     @param `filename`: (Optional) Name of file. It is neccessary if\
-        file doesn't have `name` attribute.   
+        file doesn't have `name` attribute.
     """
+    __slots__ = ("_file", "_filename", "_enctype", "_headers", "_body")
+    _KIND: ClassVar[int] = _KIND_FILE
+
     def __init__(self,
-            name: str,
-            file: Union[str, bytes, io.IOBase, Iterable],
+            name: Union[str, bytes],
+            file: Union[str, bytes, io.IOBase, Iterable[Any]],
             filename: Optional[str] = None
             ) -> None:
         super().__init__(name)
 
-        is_file = any([
-            isinstance(file, (str, bytes)),
-            isinstance(file, io.IOBase),
-            hasattr(file, "__iter__")
-        ])
+        is_file = (
+            isinstance(file, (str, bytes, io.IOBase))
+            or hasattr(file, "__iter__")
+        )
 
         if not is_file:
             raise TypeError("file is expected as a file-like object or "
@@ -133,48 +261,60 @@ class FileContent(Content):
 
         # Get filename if the filename parameter hasn't been passed and the 
         # file object provides one.
-        if filename is None and hasattr(file, "name"):
-            if callable(file.name):
-                filename = file.name()
-            else:
-                filename = file.name
+        if filename is None:
+            filename = getattr(file, "name", None)
+            if callable(filename):
+                filename = filename()
 
         if filename is None:
             raise ValueError("Please provide filename explicitly if "
             "file doesn't have name attribute")
 
         # Remove redundant path in filename
-        self._filename = os.path.split(filename)[1]
+        self._filename = os.path.basename(filename)
 
         # Guess the Content-Type of the file relying on filename.  If it can't,
         # the default value will be set.
-        self._enctype = mimetypes.guess_type(filename)[0]
-        if self._enctype is None:
+        enctype = _guess_type(self._filename)
+        if enctype is None:
             if isinstance(file, (io.TextIOBase, str)):
-                self._enctype = TEXT_PLAIN
+                enctype = TEXT_PLAIN
             else:
-                self._enctype = APPLICATION_OCTET_STREAM
+                enctype = APPLICATION_OCTET_STREAM
+
+        self._enctype: str = enctype
 
         self._file = file
 
-    def enctype(self):
+        self._headers: Dict[str, str] = {
+            CONTENT_TYPE: self._enctype,
+            CONTENT_DISPOSITION: "attachment; filename=" + self._filename,
+        }
+
+        # A large `bytes` file is streamed as the body rather than being sent
+        # at once.  `str` files are left as they are, so that they are always
+        # encoded the same way.  `MultiContent` still uses the file itself.
+        self._body: Any = file
+        if isinstance(file, (bytes, bytearray)) \
+                and len(file) > _CHUNK_THRESHOLD:
+            self._body = _Chunks(file, _CHUNK_SIZE)
+            self._headers[CONTENT_LENGTH] = str(len(file))
+
+    def enctype(self) -> str:
         return self._enctype
 
-    def filename(self):
+    def filename(self) -> str:
         return self._filename
 
-    def _build(self) -> Dict:
+    def _build(self) -> _REQUEST_PARAMS:
         """ The file will be sent in the HTTP request body.  This method
         specifies two headers, which are Content-Type and Content-Disposition.
         They can be received and processed at the server.
         """
+        # The headers are copied because the caller may update them.
         return {
-            "data": self._file,
-            "headers": {
-                CONTENT_TYPE: self.enctype(),
-                CONTENT_DISPOSITION: "attachment; filename={}"
-                    .format(self._filename),
-            }
+            "data": self._body,
+            "headers": self._headers.copy(),
         }
 
 
@@ -183,20 +323,34 @@ class JSONContent(Content):
     @param `name`: Name of `Content`.
     @param `json`: A serializable JSON object, such as `dict`.
     """
-    def __init__(self, name: str, json: Any) -> None:
+    __slots__ = ("_json", "_serialized")
+    _KIND: ClassVar[int] = _KIND_JSON
+
+    def __init__(self, name: Union[str, bytes], json: Any) -> None:
         super().__init__(name)
 
+        # Serializing here validates the object, and the result is what is
+        # sent, so the object is never serialized again when it is built.
         try:
-            jsondumps(json, allow_nan=False)
+            self._serialized = _dumps(json)
         except ValueError:
             raise ValueError("json is expected a serializable json "
             "object")
 
         self._json = json
 
-    def _build(self) -> Dict:
+    def serialized(self) -> bytes:
+        """ Return the serialized JSON of this `Content`.
+        """
+        return self._serialized
+
+    def _build(self) -> _REQUEST_PARAMS:
+        """ The serialized JSON is sent as the body instead of passing the
+        object as `json`, which would make `requests` serialize it again.
+        """
         return {
-            "json": self._json
+            "data": self._serialized,
+            "headers": {CONTENT_TYPE: APPLICATION_JSON},
         }
 
     def enctype(self) -> str:
@@ -204,57 +358,23 @@ class JSONContent(Content):
         return APPLICATION_JSON
 
 
-def _extract(d: Dict):
-    if len(d.keys()) != 1:
-        raise ValueError(
-            "Only one-element dict can be extracted, "
-            "{} element(s) found.".format(len(d.keys()))
-        )
-
-    key = list(d.keys())[0]
-    value = d[key]
-
-    return key, value
-
-
-def _create_or_append(d: Dict, k: Any, v: Any):
-    if k not in d.keys():
-        d.update({k: [v]})
-    else:
-        d[k].append(v)
-
-
-def _create_or_raise(d: Dict, k: Any, v: Any):
-    if k in d.keys():
-        raise DuplicateValue("Duplicated key ({})".format(k))
-
-    d.update({k: v})
-
-
-def _exact_is_instance(__obj, __class_or_tuple):
-    if not hasattr(__class_or_tuple, "__iter__"):
-        __class_or_tuple = (__class_or_tuple, )
-
-    if not isinstance(__obj, __class_or_tuple):
-        return False
-
-    for cls in __class_or_tuple:
-        if type(__obj) == cls:
-            return True
-
-    return False
-
-
 class MultiContent(Content):
     """ A `Content` send data as multipart/form-data.
     @param name: Name of `Content`.
     """
-    def __init__(self, name: str) -> None:
+    __slots__ = ("_params", "_fields", "_files", "_enctype")
+
+    def __init__(self, name: Union[str, bytes]) -> None:
         super().__init__(name)
-        self._content_list: List[Content] = []
+        # Members are grouped by the parameter they are put in.  Files and
+        # JSONs are kept in the order they are added as (name, value) pairs of
+        # `files`.
+        self._params: List[ParamContent] = []
+        self._fields: List[FieldContent] = []
+        self._files: List[Tuple[Union[str, bytes], Tuple[Any, Any, str]]] = []
         self._enctype = APPLICATION_X_WWW_FORM_URLENCODED
 
-    def add(self, *contents: Content):
+    def add(self, *contents: Content) -> None:
         """ Add `Content`s to the `MultiContent` form.
         - `Param` always appears in url path.
         - Other `Content`s will be put inside the body of request.
@@ -262,47 +382,59 @@ class MultiContent(Content):
         @param `contents`: One or many `Content`s.
         """
         for content in contents:
-            if not _exact_is_instance(content, (
-                        ParamContent, FieldContent, FileContent, JSONContent
-                    )):
+            kind = getattr(content, "_KIND", -1)
+            if kind == _KIND_PARAM:
+                self._params.append(cast(ParamContent, content))
+            elif kind == _KIND_FIELD:
+                self._fields.append(cast(FieldContent, content))
+            elif kind == _KIND_FILE:
+                file = cast(FileContent, content)
+                self._files.append((file._name,
+                    (file._filename, file._file, file._enctype)))
+            elif kind == _KIND_JSON:
+                json = cast(JSONContent, content)
+                self._files.append((json._name,
+                    (None, json._serialized, APPLICATION_JSON)))
+            else:
                 raise TypeError(
                     "Unsupported Content ({})"
                     .format(type(content).__name__)
                 )
 
-            if not isinstance(content, (FieldContent, ParamContent)):
+            if kind >= _KIND_FILE:
                 self._enctype = MULTIPART_FORM_DATA
 
-            self._content_list.append(content)
-
         return None
 
-    def _build(self) -> Dict:
-        parameters = {"params": {}, "data": {}, "files": {}}
+    def _build(self) -> _REQUEST_PARAMS:
+        """ Each group of members is put in its parameter by a separate loop.
+        Parameters without any member are left out.
+        """
+        parameters: _REQUEST_PARAMS = {}
+
+        if self._params:
+            params: Dict[Union[str, bytes], List[Union[str, bytes]]] = {}
+            for param in self._params:
+                params.setdefault(param._name, []).append(param._value)
+
+            parameters["params"] = params
 
-        for content in self._content_list:
-            if isinstance(content, ParamContent):
-                name, value = _extract(content.build()["params"])
-                _create_or_append(parameters["params"], name, value)
+        if self._fields:
+            data: Dict[Union[str, bytes], List[Union[str, bytes]]] = {}
+            for field in self._fields:
+                data.setdefault(field._name, []).append(field._value)
 
-            if isinstance(content, FieldContent):
-                name, value = _extract(content.build()["data"])
-                _create_or_append(parameters["data"], name, value)
+            parameters["data"] = data
 
-            if isinstance(content, FileContent):
-                name = content.name()
-                file = content.build()["data"]
-                enctype = content.enctype()
-                filename = content.filename()
+        if self._files:
+            files: Dict[Union[str, bytes], Tuple[Any, Any, str]] = {}
+            for name, value in self._files:
+                if name in files:
+                    raise DuplicateValue("Duplicated key ({!r})".format(name))
 
-                value = (filename, file, enctype)
-                _create_or_raise(parameters["files"], name, value)
+                files[name] = value
 
-            if isinstance(content, JSONContent):
-                name = content.name()
-                json = jsondumps(content.build()["json"])
-                value = (None, json, APPLICATION_JSON)
-                _create_or_raise(parameters["files"], name, value)
+            parameters["files"] = files
 
         return parameters
 
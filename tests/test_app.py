@@ -32,5 +32,46 @@ def test_app():
     print(resp)
 
 
+def test_crequest_passes_extra_parameters():
+    # Not a subclass of `FieldContent`, since the classes compiled by mypyc
+    # can't be subclassed.
+    class TimeoutContent:
+        def __init__(self, name, value):
+            self._field = FieldContent(name, value)
+
+        def build(self):
+            parameters = self._field.build()
+            parameters["timeout"] = 5
+            return parameters
+
+    class RecordingApp(browser.App):
+        def request(self, method, url, **kwargs):
+            return kwargs
+
+    content = TimeoutContent("field1", "ratatatata")
+    kwargs = RecordingApp().cpost("http://localhost:8000/", content)
+    assert kwargs["data"] == {"field1": "ratatatata"}
+    assert kwargs["timeout"] == 5
+
+    kwargs = RecordingApp().cpost(
+        "http://localhost:8000/", content, timeout=1, headers={"X-A": "1"}
+    )
+    assert kwargs["timeout"] == 1
+    assert kwargs["headers"] == {"X-A": "1"}
+
+
+def test_c_methods_call_overridden_crequest():
+    class RecordingApp(browser.App):
+        def crequest(self, method, url, content, **kwargs):
+            return method, url, content, kwargs
+
+    content = FieldContent("field1", "ratatatata")
+    app = RecordingApp()
+
+    assert app.cget("http://localhost:8000/", content, timeout=1) \
+        == ("get", "http://localhost:8000/", content, {"timeout": 1})
+    assert app.cpatch("http://localhost:8000/", content)[0] == "patch"
+
+
 if __name__ == "__main__":
     test_app()
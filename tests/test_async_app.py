@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from hyperad.async_app import AsyncApp
+from hyperad.constants import CONTENT_DISPOSITION, CONTENT_TYPE
+from hyperad.contents import (
+    FieldContent, FileContent, JSONContent, MultiContent, ParamContent
+)
+
+
+def _submit(*contents, **kwargs):
+    """ Post each content with an `AsyncApp` and return the requests which
+    reached the transport.
+    """
+    requests = []
+
+    def handler(request):
+        request.read()
+        requests.append(request)
+        return httpx.Response(200)
+
+    async def submit():
+        transport = httpx.MockTransport(handler)
+        async with AsyncApp(transport=transport) as client:
+            await asyncio.gather(*(
+                client.cpost("http://localhost/", content, **kwargs)
+                for content in contents
+            ))
+
+    asyncio.run(submit())
+    return requests
+
+
+def test_multipart_form():
+    form = MultiContent("form")
+    form.add(
+        ParamContent("param1", "suboiz"),
+        FieldContent("field1", "ratatatata"),
+        FieldContent("field1", "narutobaco"),
+        FileContent("file", b"file content", "file.txt"),
+        JSONContent("json", {"luffee": "hancock"}),
+    )
+
+    request, = _submit(form)
+
+    assert request.url.params.get_list("param1") == ["suboiz"]
+    assert request.headers[CONTENT_TYPE].startswith("multipart/form-data")
+
+    body = request.content
+    assert body.count(b'name="field1"') == 2
+    assert b"ratatatata" in body and b"narutobaco" in body
+    assert b'name="file"; filename="file.txt"' in body
+    assert b"file content" in body
+    assert b'name="json"' in body
+    assert JSONContent("json", {"luffee": "hancock"}).serialized() in body
+
+
+def test_content_bodies():
+    json = JSONContent("json", {"luffee": "hancock"})
+    files = [
+        FileContent("file", b"abc", "a.bin"),
+        FileContent("file", bytearray(b"abc"), "a.bin"),
+        FileContent("file", [b"a", "b", bytearray(b"c")], "a.bin"),
+    ]
+
+    requests = _submit(json, *files)
+
+    assert requests[0].content == json.serialized()
+    assert requests[0].headers[CONTENT_TYPE] == "application/json"
+    for request in requests[1:]:
+        assert request.content == b"abc"
+        assert request.headers[CONTENT_TYPE] == "application/octet-stream"
+        assert request.headers[CONTENT_DISPOSITION] \
+            == "attachment; filename=a.bin"
+
+
+def test_merged_headers():
+    file = FileContent("file", b"abc", "a.bin")
+    field = FieldContent("field1", "ratatatata")
+
+    file_request, field_request = _submit(file, field, headers={"X-A": "1"})
+
+    assert file_request.headers["X-A"] == "1"
+    assert file_request.headers[CONTENT_DISPOSITION] \
+        == "attachment; filename=a.bin"
+    assert field_request.headers["X-A"] == "1"
+    assert field_request.content == b"field1=ratatatata"
+
+
+def test_override_built_header_in_other_case():
+    content_type = "application/vnd+json"
+    json = JSONContent("json", {"luffee": "hancock"})
+    file = FileContent("file", b"abc", "a.bin")
+
+    for request in _submit(json, file, headers={"content-type": content_type}):
+        assert request.headers.get_list(CONTENT_TYPE) == [content_type]
+
+
+def test_bytes_names():
+    multipart = MultiContent("form")
+    multipart.add(
+        ParamContent(b"param1", b"suboiz"),
+        FieldContent(b"field1", b"ratatatata"),
+        FileContent(b"file", b"abc", "a.bin"),
+        JSONContent(b"json", {"luffee": "hancock"}),
+    )
+    urlencoded = MultiContent("form")
+    urlencoded.add(FieldContent(b"field1", b"ratatatata"))
+
+    requests = _submit(multipart, urlencoded, FieldContent(b"field1", b"v"))
+
+    assert requests[0].url.params["param1"] == "suboiz"
+    body = requests[0].content
+    assert b'name="field1"\r\n\r\nratatatata' in body
+    assert b'name="file"; filename="a.bin"' in body
+    assert b'name="json"' in body
+    assert requests[1].content == b"field1=ratatatata"
+    assert requests[2].content == b"field1=v"
+
+
+def test_non_utf8_bytes_name():
+    with pytest.raises(ValueError):
+        _submit(FieldContent(b"\xff", "ratatatata"))
+
+
+@pytest.mark.parametrize("name", ["data", "json", "files", "params"])
+def test_reserved_kwargs(name):
+    with pytest.raises(ValueError):
+        _submit(FieldContent("field1", "ratatatata"), **{name: None})
+
+
+def test_c_methods_call_overridden_crequest():
+    class RecordingApp(AsyncApp):
+        async def crequest(self, method, url, content, **kwargs):
+            return method, url, content, kwargs
+
+    async def submit():
+        async with RecordingApp() as client:
+            return await client.cput("http://localhost/", json, timeout=1)
+
+    json = JSONContent("json", {"luffee": "hancock"})
+
+    assert asyncio.run(submit()) \
+        == ("put", "http://localhost/", json, {"timeout": 1})
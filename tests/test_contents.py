@@ -0,0 +1,198 @@
+import datetime
+import enum
+import json
+import uuid
+
+import pytest
+
+from hyperad import contents
+from hyperad.constants import CONTENT_LENGTH
+from hyperad.contents import (
+    FieldContent, FileContent, JSONContent, MultiContent, ParamContent
+)
+from hyperad.errors import DuplicateValue
+
+
+class Color(enum.Enum):
+    RED = 1
+
+
+PAYLOADS = [
+    {"k": "null", "n": None, "f": [1.5, True]},
+    {"t": datetime.datetime(2021, 1, 1)},
+    {"t": datetime.datetime(2021, 1, 1), "n": None},
+    {1: "int key", None: "none key"},
+    {(1,): "tuple key"},
+    {"n": float("nan")},
+    [float("inf")],
+    uuid.UUID(int=1),
+    Color.RED,
+    (1, 2),
+    {"items": [(1, "x"), (2, "y")]},
+    {"ids": [uuid.UUID(int=1)], "colors": (Color.RED,)},
+    {"big": 2 ** 70},
+]
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_dumps_accepts_what_json_accepts(monkeypatch, has_orjson, payload):
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(contents, "_HAS_ORJSON", has_orjson)
+
+    try:
+        expected = json.dumps(payload, allow_nan=False)
+    except (TypeError, ValueError) as e:
+        with pytest.raises(type(e)):
+            contents._dumps(payload)
+    else:
+        assert json.loads(contents._dumps(payload)) == json.loads(expected)
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_dumps_rejects_circular_reference(monkeypatch, has_orjson):
+    if has_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(contents, "_HAS_ORJSON", has_orjson)
+
+    circular = []
+    circular.append(circular)
+    with pytest.raises(ValueError):
+        contents._dumps(circular)
+
+
+def test_json_content_rejects_nan():
+    with pytest.raises(ValueError):
+        JSONContent("json", {"n": float("nan")})
+
+
+@pytest.mark.parametrize("filename, enctype", [
+    ("report.pdf", "application/pdf"),
+    ("archive.tar.gz", "application/x-tar"),
+    ("notes", "application/octet-stream"),
+    ("data:notes.txt", "text/plain"),
+])
+def test_file_content_guesses_type(filename, enctype):
+    assert FileContent("file", b"abc", filename).enctype() == enctype
+
+
+def test_guess_type_cache_is_keyed_on_extensions():
+    contents._guess_suffix_type.cache_clear()
+    for i in range(10):
+        FileContent("file", b"abc", "report-{}.v2.pdf".format(i))
+
+    info = contents._guess_suffix_type.cache_info()
+    assert (info.misses, info.currsize) == (1, 1)
+
+
+@pytest.mark.parametrize("large", [bytes, bytearray])
+def test_large_file_is_sent_in_chunks(large):
+    file = large(b"x" * (contents._CHUNK_THRESHOLD + 1))
+
+    parameters = FileContent("file", file, "a.bin").build()
+
+    body = parameters["data"]
+    assert len(body) == len(file)
+    assert parameters["headers"][CONTENT_LENGTH] == str(len(file))
+    # The body can be iterated again, e.g. when a request is retried.
+    for _ in range(2):
+        chunks = list(body)
+        assert all(len(chunk) <= contents._CHUNK_SIZE for chunk in chunks)
+        assert b"".join(chunks) == file
+
+
+@pytest.mark.parametrize("file", [
+    b"x" * contents._CHUNK_THRESHOLD,
+    "x" * (contents._CHUNK_THRESHOLD + 1),
+])
+def test_file_is_sent_at_once(file):
+    parameters = FileContent("file", file, "a.bin").build()
+
+    assert parameters["data"] is file
+    assert CONTENT_LENGTH not in parameters["headers"]
+
+
+def test_multi_content_keeps_large_file():
+    file = b"x" * (contents._CHUNK_THRESHOLD + 1)
+    form = MultiContent("form")
+    form.add(FileContent("file", file, "a.bin"))
+
+    _, sent, _ = form.build()["files"]["file"]
+
+    assert sent is file
+
+
+def test_multi_content_leaves_out_empty_parameters():
+    assert MultiContent("form").build() == {}
+
+    form = MultiContent("form")
+    form.add(ParamContent("param1", "suboiz"))
+    assert form.build() == {"params": {"param1": ["suboiz"]}}
+
+    form = MultiContent("form")
+    form.add(FieldContent("field1", "ratatatata"))
+    assert form.build() == {"data": {"field1": ["ratatatata"]}}
+
+
+def test_multi_content_groups_members():
+    json = JSONContent("json", {"luffee": "hancock"})
+    form = MultiContent("form")
+    form.add(
+        FieldContent("field1", "ratatatata"),
+        JSONContent("json", {"luffee": "hancock"}),
+        ParamContent("param1", "suboiz"),
+        FileContent("file", b"abc", "a.bin"),
+        FieldContent("field2", "narutobaco"),
+        ParamContent("param1", "tenten"),
+        FieldContent("field1", "sasuketamin"),
+    )
+
+    parameters = form.build()
+
+    assert parameters["params"] == {"param1": ["suboiz", "tenten"]}
+    assert parameters["data"] == {
+        "field1": ["ratatatata", "sasuketamin"],
+        "field2": ["narutobaco"],
+    }
+    # Files and JSONs keep the order they were added in.
+    assert list(parameters["files"].items()) == [
+        ("json", (None, json.serialized(), "application/json")),
+        ("file", ("a.bin", b"abc", "application/octet-stream")),
+    ]
+    assert form.enctype() == "multipart/form-data"
+
+
+def test_multi_content_duplicated_file_name():
+    form = MultiContent("form")
+    # The duplication is only found when the form is built.
+    form.add(
+        FileContent("file", b"abc", "a.bin"),
+        JSONContent("file", {"luffee": "hancock"}),
+    )
+
+    with pytest.raises(DuplicateValue):
+        form.build()
+
+
+def test_multi_content_accepts_subclasses():
+    if hasattr(MultiContent, "__mypyc_attrs__"):
+        pytest.skip("mypyc compiled classes can't be subclassed")
+
+    class Field(FieldContent):
+        pass
+
+    form = MultiContent("form")
+    form.add(Field("field1", "ratatatata"))
+
+    assert form.build() == {"data": {"field1": ["ratatatata"]}}
+
+
+@pytest.mark.parametrize("content", [
+    MultiContent("form"),
+    "field1=ratatatata",
+    object(),
+])
+def test_multi_content_rejects_unsupported_contents(content):
+    with pytest.raises(TypeError):
+        MultiContent("form").add(content)